@@ -9,13 +9,209 @@ import os
 import re
 import shutil
 from pathlib import Path
-from typing import List, Tuple, Optional, Dict
-from collections import defaultdict, Counter
+from typing import List, Tuple, Optional, Dict, Iterator
+from collections import defaultdict, deque, Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import closing
+from itertools import islice
+import hashlib
+import importlib.metadata
+import heapq
 import io
+import mmap
+import sqlite3
+import threading
+import uuid
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional document libraries, resolved once at import time
+# pdfplumber is heavy to import and only used when PyPDF2 is missing
+pdfplumber = None
+try:
+    import PyPDF2
+except ImportError:
+    PyPDF2 = None
+    try:
+        import pdfplumber
+    except ImportError:
+        pass
+
+try:
+    import docx
+except ImportError:
+    docx = None
+
+# Minimum filename score for a resume to be placed without reading its content
+FILENAME_MATCH_THRESHOLD = 3
+
+# A PDF stops being read once the leading role is ahead of the runner-up by more
+# than PDF_DECISIVE_MARGIN, provided at least PDF_MIN_PAGES pages have been read
+PDF_MIN_PAGES = 2
+PDF_DECISIVE_MARGIN = 10
+
+# Default location of the persistent analysis cache
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'organize-resumes'
+
+# Bump whenever text extraction or scoring changes, to invalidate cached results
+CACHE_VERSION = 1
+
+# Read size used when hashing files for the cache
+CACHE_HASH_CHUNK_SIZE = 1024 * 1024
+
+# ASCII control bytes stripped from legacy .doc files before decoding. Bytes >= 0x80
+# are kept so UTF-8 sequences (accented keywords) survive
+_DOC_DELETE_BYTES = bytes(b for b in range(128) if not (chr(b).isprintable() or chr(b).isspace()))
+
+# Number of files analyzed ahead of the one being moved in sequential mode
+PREFETCH_FILES = 4
+
+
+def _is_word_char(c: str) -> bool:
+    """Return True if c is a regex word character (\\w)."""
+    return c.isalnum() or c == '_'
+
+
+def _is_word_boundary(text: str, pos: int) -> bool:
+    """Return True if there is a word boundary (\\b) at position pos of text."""
+    before = pos > 0 and _is_word_char(text[pos - 1])
+    after = pos < len(text) and _is_word_char(text[pos])
+    return before != after
+
+
+def _iter_pdf_pages_pypdf2(file_path: Path) -> Iterator[str]:
+    """Yield the text of each page of a PDF file with PyPDF2."""
+    with open(file_path, 'rb') as f:
+        pdf_reader = PyPDF2.PdfReader(f)
+        for page in pdf_reader.pages:
+            yield page.extract_text()
+
+
+def _iter_pdf_pages_pdfplumber(file_path: Path) -> Iterator[str]:
+    """Yield the text of each page of a PDF file with pdfplumber, skipping empty pages."""
+    with pdfplumber.open(file_path) as pdf:
+        for page in pdf.pages:
+            page_text = page.extract_text()
+            if page_text:
+                yield page_text
+
+
+# PDF page reader to use: PyPDF2 first, then pdfplumber, or None if neither is installed
+if PyPDF2 is not None:
+    _PDF_BACKEND = _iter_pdf_pages_pypdf2
+elif pdfplumber is not None:
+    _PDF_BACKEND = _iter_pdf_pages_pdfplumber
+else:
+    _PDF_BACKEND = None
+
+
+def _library_version(module, distribution: str) -> Optional[str]:
+    """Version of an optional library, or None if it is not installed or unknown."""
+    if module is None:
+        return None
+    version = getattr(module, '__version__', None)
+    if version is None:
+        try:
+            version = importlib.metadata.version(distribution)
+        except importlib.metadata.PackageNotFoundError:
+            pass
+    return version
+
+
+# Connections inherited from a parent process through fork(). They are kept
+# referenced so they are never closed (or otherwise used) in the child
+_inherited_cache_connections = []
+
+
+class ResultCache:
+    """
+    Persistent cache of analysis results, keyed by file content, stored in SQLite.
+    Safe to share between threads and worker processes: each process uses its own
+    connection, opened on first use. A connection inherited through fork() is left
+    untouched and a new one is opened.
+    """
+    
+    def __init__(self, cache_dir: str):
+        self.path = Path(cache_dir) / 'results.sqlite3'
+        self._conn = None
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+    
+    def __getstate__(self):
+        # Connections and locks cannot be pickled into worker processes
+        state = self.__dict__.copy()
+        state['_conn'] = None
+        state['_lock'] = None
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+    
+    def _check_process(self):
+        """Drop the connection and lock inherited from a parent process after fork()."""
+        if self._pid != os.getpid():
+            # SQLite connections must not be used across fork(); the lock may also
+            # have been held by another thread of the parent when it forked
+            if self._conn is not None:
+                _inherited_cache_connections.append(self._conn)
+            self._conn = None
+            self._lock = threading.Lock()
+            self._pid = os.getpid()
+    
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None,
+                                         check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, role TEXT, score INTEGER)'
+            )
+        return self._conn
+    
+    def get(self, key: str) -> Tuple[bool, Optional[Tuple[str, int]]]:
+        """
+        Look up a cached result.
+        
+        Returns:
+            Tuple of (found, (role_name, score) or None if the file was unmatched)
+        """
+        self._check_process()
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    'SELECT role, score FROM results WHERE key = ?', (key,)
+                ).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            print(f"[WARNING] Could not read cache {self.path}: {e}")
+            return (False, None)
+        if row is None:
+            return (False, None)
+        role_name, score = row
+        return (True, (role_name, score) if role_name is not None else None)
+    
+    def put(self, key: str, result: Optional[Tuple[str, int]]):
+        """Store the (role_name, score) result for a file, or None if it was unmatched."""
+        role_name, score = result if result else (None, None)
+        self._check_process()
+        try:
+            with self._lock:
+                self._connect().execute(
+                    'INSERT OR REPLACE INTO results (key, role, score) VALUES (?, ?, ?)',
+                    (key, role_name, score)
+                )
+        except (sqlite3.Error, OSError) as e:
+            print(f"[WARNING] Could not write cache {self.path}: {e}")
 
 
 class ResumeOrganizer:
-    def __init__(self, root_dir: str, dry_run: bool = True, manual_mappings: Optional[dict] = None):
+    def __init__(self, root_dir: str, dry_run: bool = True, manual_mappings: Optional[dict] = None,
+                 max_workers: Optional[int] = None, cache_dir: Optional[str] = None):
         """
         Initialize the Resume Organizer.
         
@@ -23,10 +219,14 @@ class ResumeOrganizer:
             root_dir: Root directory containing CVs
             dry_run: If True, only show what would be done without actually moving files
             manual_mappings: Dictionary mapping filenames to target folders
+            max_workers: Number of processes used to analyze files (default: CPU count, 1 or less disables)
+            cache_dir: Directory for the persistent analysis cache (default: no caching)
         """
         self.root_dir = Path(root_dir)
         self.dry_run = dry_run
         self.manual_mappings = manual_mappings or {}
+        self.max_workers = max_workers
+        self.cache = ResultCache(cache_dir) if cache_dir else None
         self.resume_extensions = {'.pdf', '.docx', '.doc', '.txt'}
         self.role_folders = []
         self.moved_files = []
@@ -36,6 +236,11 @@ class ResumeOrganizer:
         
         # Build technology and role keyword mapping
         self.role_keywords = self._build_role_keywords()
+        self._flatten_role_keywords()
+        self._ac = self._build_keyword_automaton()
+        if self._ac is None:
+            self._keyword_pattern = self._build_keyword_pattern()
+        self._analysis_fingerprint = self._build_analysis_fingerprint()
         
     def _build_role_keywords(self) -> Dict[str, List[str]]:
         """
@@ -203,60 +408,144 @@ class ResumeOrganizer:
             ]
         }
     
+    def _flatten_role_keywords(self):
+        """
+        Flatten role_keywords into parallel tuples, one entry per (role, keyword) pair,
+        with roles referred to by their index in _role_names. Scoring works on role
+        indices and only maps back to names at the end.
+        
+        Also builds _keyword_role_map, mapping each distinct keyword to the ids of all
+        roles it belongs to, so a keyword shared by several roles is matched only once.
+        """
+        self._role_names = tuple(self.role_keywords)
+        self._keywords = tuple(
+            keyword.lower()
+            for role in self._role_names
+            for keyword in self.role_keywords[role]
+        )
+        self._keyword_role_ids = tuple(
+            role_id
+            for role_id, role in enumerate(self._role_names)
+            for _ in self.role_keywords[role]
+        )
+        keyword_role_map = defaultdict(list)
+        for keyword, role_id in zip(self._keywords, self._keyword_role_ids):
+            keyword_role_map[keyword].append(role_id)
+        self._keyword_role_map = {
+            keyword: tuple(role_ids) for keyword, role_ids in keyword_role_map.items()
+        }
+    
+    def _build_keyword_automaton(self):
+        """
+        Build a single Aho-Corasick automaton over all role keywords so a resume
+        can be scanned in one pass. Returns None if pyahocorasick is not installed.
+        """
+        if ahocorasick is None:
+            return None
+        automaton = ahocorasick.Automaton()
+        for kw, role_ids in self._keyword_role_map.items():
+            # Whether the keyword starts/ends with a word character is fixed,
+            # so the boundary check only has to classify the neighbouring chars
+            automaton.add_word(kw, (len(kw), _is_word_char(kw[0]), _is_word_char(kw[-1]), role_ids))
+        automaton.make_automaton()
+        return automaton
+    
+    def _build_keyword_pattern(self):
+        """
+        Build a single precompiled regex matching any role keyword as a whole word.
+        Used when pyahocorasick is not installed.
+        """
+        keyword_roles = self._keyword_role_map
+        
+        # Longest first, so the alternation picks the longest keyword at each position
+        self._all_keywords = sorted(keyword_roles, key=len, reverse=True)
+        
+        # Any shorter keyword that also matches at the same position is a prefix
+        # of the longest one, so a hit credits the roles of those prefixes too
+        self._kw_to_roles = {}
+        for keyword in self._all_keywords:
+            role_ids = list(keyword_roles[keyword])
+            for i in range(1, len(keyword)):
+                prefix = keyword[:i]
+                if prefix in keyword_roles and _is_word_boundary(keyword, i):
+                    role_ids.extend(keyword_roles[prefix])
+            self._kw_to_roles[keyword] = role_ids
+        
+        # Lookahead keeps matches zero-width so overlapping keywords are all found
+        alternation = '|'.join(re.escape(k) for k in self._all_keywords)
+        return re.compile(r'(?=\b(' + alternation + r')\b)')
+    
+    def _build_analysis_fingerprint(self) -> str:
+        """
+        Fingerprint of everything besides file content that affects analysis results,
+        so cached results are invalidated when keywords or settings change.
+        """
+        settings = (
+            CACHE_VERSION,
+            'ahocorasick' if self._ac is not None else 're',
+            list(self.role_keywords.items()),
+            PDF_MIN_PAGES,
+            PDF_DECISIVE_MARGIN,
+            _PDF_BACKEND.__name__ if _PDF_BACKEND else None,
+            docx is not None,
+            # Library upgrades can change extracted text or matching
+            _library_version(PyPDF2, 'PyPDF2'),
+            _library_version(pdfplumber, 'pdfplumber'),
+            _library_version(docx, 'python-docx'),
+            _library_version(ahocorasick, 'pyahocorasick')
+        )
+        return hashlib.blake2b(repr(settings).encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _cache_key(self, file_path: Path) -> str:
+        """Cache key for a file: its content hash, its name and the analysis fingerprint."""
+        content_hash = hashlib.blake2b(digest_size=16)
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(CACHE_HASH_CHUNK_SIZE), b''):
+                content_hash.update(chunk)
+        # The name is part of the key because short resumes are also scored on their filename
+        return f"{content_hash.hexdigest()}:{file_path.name}:{self._analysis_fingerprint}"
+    
     def get_role_folders(self) -> List[Path]:
         """Get all role folder directories."""
         if not self.role_folders:
-            for item in self.root_dir.iterdir():
-                if item.is_dir() and not item.name.startswith('.'):
-                    excluded = {'desktop.ini', '__pycache__', '.git'}
-                    if item.name not in excluded:
-                        self.role_folders.append(item)
+            excluded = {'desktop.ini', '__pycache__', '.git'}
+            with os.scandir(self.root_dir) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.') or entry.name in excluded:
+                        continue
+                    if entry.is_dir():
+                        self.role_folders.append(Path(entry.path))
         return self.role_folders
     
+    def iter_pdf_pages(self, file_path: Path) -> Iterator[str]:
+        """Yield the text of each page of a PDF file."""
+        if _PDF_BACKEND is None:
+            print(f"[WARNING] No PDF library found. Install PyPDF2 or pdfplumber: pip install PyPDF2")
+            return
+        yield from _PDF_BACKEND(file_path)
+    
     def extract_text_from_pdf(self, file_path: Path) -> str:
         """Extract text from PDF file."""
-        text = ""
         try:
-            # Try PyPDF2 first
-            try:
-                import PyPDF2
-                with open(file_path, 'rb') as f:
-                    pdf_reader = PyPDF2.PdfReader(f)
-                    for page in pdf_reader.pages:
-                        text += page.extract_text() + "\n"
-                return text
-            except ImportError:
-                # Try pdfplumber
-                try:
-                    import pdfplumber
-                    with pdfplumber.open(file_path) as pdf:
-                        for page in pdf.pages:
-                            text += page.extract_text() + "\n" if page.extract_text() else ""
-                    return text
-                except ImportError:
-                    print(f"[WARNING] No PDF library found. Install PyPDF2 or pdfplumber: pip install PyPDF2")
-                    return ""
+            return "\n".join(self.iter_pdf_pages(file_path))
         except Exception as e:
             print(f"[WARNING] Error reading PDF {file_path.name}: {e}")
             return ""
     
     def extract_text_from_docx(self, file_path: Path) -> str:
         """Extract text from DOCX file."""
-        text = ""
+        if docx is None:
+            print(f"[WARNING] python-docx not found. Install it: pip install python-docx")
+            return ""
         try:
-            import docx
             doc = docx.Document(file_path)
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
+            parts = [paragraph.text for paragraph in doc.paragraphs]
             # Also extract from tables
             for table in doc.tables:
                 for row in table.rows:
                     for cell in row.cells:
-                        text += cell.text + "\n"
-            return text
-        except ImportError:
-            print(f"[WARNING] python-docx not found. Install it: pip install python-docx")
-            return ""
+                        parts.append(cell.text)
+            return "\n".join(parts)
         except Exception as e:
             print(f"[WARNING] Error reading DOCX {file_path.name}: {e}")
             return ""
@@ -271,8 +560,12 @@ class ResumeOrganizer:
             return self.extract_text_from_docx(file_path)
         elif ext == '.txt':
             try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    return f.read()
+                with open(file_path, 'rb') as f:
+                    if os.fstat(f.fileno()).st_size == 0:
+                        return ""
+                    # Decode straight from the mapped file, without an intermediate bytes copy
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        return str(mm, 'utf-8', 'ignore')
             except Exception as e:
                 print(f"[WARNING] Error reading TXT {file_path.name}: {e}")
                 return ""
@@ -282,11 +575,9 @@ class ResumeOrganizer:
             try:
                 with open(file_path, 'rb') as f:
                     content = f.read()
-                    # Try to extract readable text (basic approach)
-                    text = content.decode('utf-8', errors='ignore')
-                    # Remove non-printable characters
-                    text = ''.join(c for c in text if c.isprintable() or c.isspace())
-                    return text
+                    # Try to extract readable text (basic approach):
+                    # remove non-printable control bytes, then decode
+                    return content.translate(None, _DOC_DELETE_BYTES).decode('utf-8', errors='ignore')
             except Exception as e:
                 print(f"[WARNING] Error reading DOC {file_path.name}: {e}")
                 return ""
@@ -300,17 +591,37 @@ class ResumeOrganizer:
         Returns:
             Dictionary mapping role names to their keyword count scores
         """
+        return dict(zip(self._role_names, self._score_text(text)))
+    
+    def _score_text(self, text: str, scores: Optional[List[int]] = None) -> List[int]:
+        """
+        Count keyword occurrences for each role, indexed like _role_names.
+        If scores is given, the counts are added to it in place.
+        """
+        if scores is None:
+            scores = [0] * len(self._role_names)
         text_lower = text.lower()
-        scores = defaultdict(int)
         
-        for role, keywords in self.role_keywords.items():
-            for keyword in keywords:
-                # Count occurrences of keyword (as whole word)
-                pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-                matches = len(re.findall(pattern, text_lower))
-                scores[role] += matches
+        if self._ac is not None:
+            # Padding with non-word characters makes the characters around every
+            # match addressable, so the boundary checks need no bounds tests
+            padded = ' ' + text_lower + ' '
+            for end, (length, word_start, word_end, role_ids) in self._ac.iter(padded):
+                # Only count whole-word matches (\b on both sides)
+                c = padded[end - length]
+                if (c.isalnum() or c == '_') == word_start:
+                    continue
+                c = padded[end + 1]
+                if (c.isalnum() or c == '_') == word_end:
+                    continue
+                for role_id in role_ids:
+                    scores[role_id] += 1
+        else:
+            for match in self._keyword_pattern.finditer(text_lower):
+                for role_id in self._kw_to_roles[match.group(1)]:
+                    scores[role_id] += 1
         
-        return dict(scores)
+        return scores
     
     def find_target_folder_from_content(self, file_path: Path) -> Optional[Tuple[Path, str, int]]:
         """
@@ -320,9 +631,98 @@ class ResumeOrganizer:
         Returns:
             Tuple of (target_folder_path, role_name, score) or None if no match
         """
+        # Skip opening the file when the filename alone is conclusive
+        filename_match = self.find_target_folder_from_filename(file_path)
+        if filename_match:
+            return filename_match
+        
+        if self.cache is None:
+            return self._analyze_file_content(file_path)
+        
+        # Reuse the result of a previous run on the same file
+        try:
+            cache_key = self._cache_key(file_path)
+        except OSError as e:
+            print(f"[WARNING] Could not hash {file_path.name} for caching: {e}")
+            return self._analyze_file_content(file_path)
+        found, cached = self.cache.get(cache_key)
+        if found:
+            if not cached:
+                return None
+            role_name, score = cached
+            return (self.root_dir / role_name, role_name, score)
+        
+        result = self._analyze_file_content(file_path)
+        self.cache.put(cache_key, result[1:] if result else None)
+        return result
+    
+    def _analyze_file_content(self, file_path: Path) -> Optional[Tuple[Path, str, int]]:
+        """Extract and score the content of a resume file."""
+        if file_path.suffix.lower() == '.pdf':
+            return self.find_target_folder_from_content_streaming(file_path)
+        
         # Try to extract text from file
         text = self.extract_text_from_file(file_path)
+        return self.find_target_folder_from_text(file_path, text)
+    
+    def find_target_folder_from_content_streaming(self, file_path: Path) -> Optional[Tuple[Path, str, int]]:
+        """
+        Analyze a PDF resume page by page, stopping as soon as one role has a decisive
+        lead (more than PDF_DECISIVE_MARGIN points after at least PDF_MIN_PAGES pages).
+        
+        Returns:
+            Tuple of (target_folder_path, role_name, score) or None if no match
+        """
+        pages = []
+        scores = [0] * len(self._role_names)
+        try:
+            with closing(self.iter_pdf_pages(file_path)) as page_texts:
+                for page_text in page_texts:
+                    pages.append(page_text)
+                    self._score_text(page_text, scores)
+                    if len(pages) >= PDF_MIN_PAGES:
+                        leader, runner_up = heapq.nlargest(2, scores)
+                        if leader - runner_up > PDF_DECISIVE_MARGIN:
+                            break
+        except Exception as e:
+            print(f"[WARNING] Error reading PDF {file_path.name}: {e}")
+            pages = []
+        
+        # Too little text: use the regular analysis, which also looks at the filename
+        text = "\n".join(pages)
+        if len(text.strip()) < 50:
+            return self.find_target_folder_from_text(file_path, text)
+        
+        return self._best_target_folder(scores, min_score=2)
+    
+    def find_target_folder_from_filename(self, file_path: Path) -> Optional[Tuple[Path, str, int]]:
+        """
+        Determine the target folder from the filename alone, without reading the file.
+        
+        Returns:
+            Tuple of (target_folder_path, role_name, score), or None unless the best role
+            scores at least FILENAME_MATCH_THRESHOLD and strictly beats the runner-up
+        """
+        filename_text = file_path.stem.replace('_', ' ').replace('-', ' ')
+        scores = self._score_text(filename_text)
         
+        top = heapq.nlargest(2, scores)
+        if not top or top[0] < FILENAME_MATCH_THRESHOLD:
+            return None
+        if len(top) > 1 and top[1] >= top[0]:
+            return None
+        
+        score = top[0]
+        role_name = self._role_names[scores.index(score)]
+        return (self.root_dir / role_name, role_name, score)
+    
+    def find_target_folder_from_text(self, file_path: Path, text: str) -> Optional[Tuple[Path, str, int]]:
+        """
+        Determine the best matching folder from already extracted resume text.
+        
+        Returns:
+            Tuple of (target_folder_path, role_name, score) or None if no match
+        """
         # If content extraction failed or returned little text, also analyze filename
         filename_text = ""
         if not text or len(text.strip()) < 50:
@@ -333,31 +733,33 @@ class ResumeOrganizer:
                 text = filename_text
         
         # Analyze content (including filename if needed)
-        scores = self.analyze_resume_content(text)
+        scores = self._score_text(text)
         
+        # Lower threshold if we only matched from filename
+        min_score = 1 if filename_text else 2
+        
+        return self._best_target_folder(scores, min_score)
+    
+    def _best_target_folder(self, scores: List[int], min_score: int) -> Optional[Tuple[Path, str, int]]:
+        """
+        Pick the highest scoring role from a per-role score list, if its score reaches min_score.
+        
+        Returns:
+            Tuple of (target_folder_path, role_name, score) or None if no match
+        """
         if not scores:
             return None
         
-        # Find the role with highest score
-        best_role = max(scores.items(), key=lambda x: x[1])
-        role_name, score = best_role
-        
-        # Lower threshold if we only matched from filename
-        min_score = 1 if filename_text else 2
+        # Find the role with highest score (the first one on ties)
+        score = max(scores)
         
         # Only proceed if score is significant
         if score < min_score:
             return None
         
-        # Check if folder exists
-        target_folder = self.root_dir / role_name
-        
-        # If folder doesn't exist, we'll create it
-        if not target_folder.exists():
-            return (target_folder, role_name, score)
-        
-        # Folder exists
-        return (target_folder, role_name, score)
+        # The folder is created later if it doesn't exist yet
+        role_name = self._role_names[scores.index(score)]
+        return (self.root_dir / role_name, role_name, score)
     
     def create_folder_if_needed(self, folder_path: Path) -> bool:
         """Create folder if it doesn't exist."""
@@ -397,20 +799,73 @@ class ResumeOrganizer:
         # Analyze file content
         return self.find_target_folder_from_content(file_path)
     
-    def should_move_file(self, file_path: Path) -> bool:
-        """Check if a file should be moved (is a resume file)."""
+    def should_move_file(self, entry: os.DirEntry) -> bool:
+        """Check if a directory entry should be moved (is a resume file)."""
         excluded_files = {
             'organize_resumes.py',
             'requirements.txt',
             'desktop.ini'
         }
+        # Name checks first; is_file() reuses the type info from the directory listing
         return (
-            file_path.is_file() and
-            file_path.suffix.lower() in self.resume_extensions and
-            not file_path.name.startswith('.') and
-            file_path.name not in excluded_files
+            os.path.splitext(entry.name)[1].lower() in self.resume_extensions and
+            not entry.name.startswith('.') and
+            entry.name not in excluded_files and
+            entry.is_file()
         )
     
+    def reserve_destination(self, target_folder: Path, file_path: Path) -> Path:
+        """
+        Claim a free destination path for file_path in target_folder by atomically
+        creating an empty placeholder file there.
+        On a name collision a short random suffix is added, e.g. "CV (3f9a1c).pdf".
+        """
+        destination = target_folder / file_path.name
+        while True:
+            try:
+                fd = os.open(destination, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                new_name = f"{file_path.stem} ({uuid.uuid4().hex[:6]}){file_path.suffix}"
+                destination = target_folder / new_name
+                continue
+            os.close(fd)
+            return destination
+    
+    def place_file(self, file_path: Path, result: Optional[Tuple[Path, str, int]]):
+        """Move a resume to its target folder (or record it as unmatched)."""
+        if result:
+            target_folder, role_name, score = result
+            
+            # Ensure folder exists
+            self.create_folder_if_needed(target_folder)
+            
+            self.matched_files.append((file_path.name, role_name, score))
+            
+            if self.dry_run:
+                print(f"[DRY RUN] Would move: {file_path.name}")
+                print(f"          -> {role_name}/ (score: {score})")
+                print()
+            else:
+                try:
+                    destination = self.reserve_destination(target_folder, file_path)
+                    try:
+                        # Replaces the empty placeholder
+                        os.replace(file_path, destination)
+                    except OSError:
+                        # e.g. target folder on another drive
+                        try:
+                            shutil.move(str(file_path), str(destination))
+                        except Exception:
+                            destination.unlink()
+                            raise
+                    print(f"[MOVED] {file_path.name} -> {role_name}/ (score: {score})")
+                    self.moved_files.append((file_path.name, role_name, score))
+                except Exception as e:
+                    print(f"[ERROR] Error moving {file_path.name}: {e}")
+        else:
+            print(f"[UNMATCHED] No match found: {file_path.name}")
+            self.unmatched_files.append(file_path.name)
+    
     def organize_resumes(self):
         """Main method to organize all resumes."""
         print(f"{'='*60}")
@@ -418,47 +873,55 @@ class ResumeOrganizer:
         print(f"{'DRY RUN MODE' if self.dry_run else 'LIVE MODE'}")
         print(f"{'='*60}\n")
         
-        # Get all resume files in root
-        root_files = [f for f in self.root_dir.iterdir() if self.should_move_file(f)]
+        # Get all resume files in root. Manually mapped files skip the resume
+        # checks and are placed right away; everything else is scored in parallel
+        mapped_names = frozenset(self.manual_mappings)
+        mapped_files = []
+        pending_files = []
+        with os.scandir(self.root_dir) as entries:
+            for entry in entries:
+                if entry.name in mapped_names and entry.is_file():
+                    mapped_files.append(Path(entry.path))
+                elif self.should_move_file(entry):
+                    pending_files.append(Path(entry.path))
         
-        print(f"Found {len(root_files)} resume files in root folder\n")
+        print(f"Found {len(mapped_files) + len(pending_files)} resume files in root folder\n")
         
-        for file_path in root_files:
-            result = self.find_target_folder(file_path)
+        for file_path in mapped_files:
+            self.place_file(file_path, self.find_target_folder(file_path))
+        
+        sequential = self.max_workers is not None and self.max_workers <= 1
+        if sequential or len(pending_files) < 2:
+            # Analyze the next few files on background threads while the
+            # current one is moved, so disk reads overlap with the rest of the work
+            with ThreadPoolExecutor(max_workers=PREFETCH_FILES) as executor:
+                pending = iter(pending_files)
+                prefetched = deque(
+                    (f, executor.submit(self.find_target_folder_from_content, f))
+                    for f in islice(pending, PREFETCH_FILES)
+                )
+                while prefetched:
+                    file_path, future = prefetched.popleft()
+                    next_file = next(pending, None)
+                    if next_file is not None:
+                        prefetched.append((next_file, executor.submit(self.find_target_folder_from_content, next_file)))
+                    self.place_file(file_path, future.result())
+        else:
+            # Largest files first, so a big PDF is not started last while the
+            # other workers sit idle (longest-processing-time-first scheduling)
+            pending_files.sort(key=_file_size, reverse=True)
             
-            if result:
-                target_folder, role_name, score = result
-                
-                # Ensure folder exists
-                self.create_folder_if_needed(target_folder)
-                
-                destination = target_folder / file_path.name
-                
-                # Handle duplicate filenames
-                counter = 1
-                while destination.exists():
-                    stem = file_path.stem
-                    suffix = file_path.suffix
-                    new_name = f"{stem} ({counter}){suffix}"
-                    destination = target_folder / new_name
-                    counter += 1
-                
-                self.matched_files.append((file_path.name, role_name, score))
-                
-                if self.dry_run:
-                    print(f"[DRY RUN] Would move: {file_path.name}")
-                    print(f"          -> {role_name}/ (score: {score})")
-                    print()
-                else:
-                    try:
-                        shutil.move(str(file_path), str(destination))
-                        print(f"[MOVED] {file_path.name} -> {role_name}/ (score: {score})")
-                        self.moved_files.append((file_path.name, role_name, score))
-                    except Exception as e:
-                        print(f"[ERROR] Error moving {file_path.name}: {e}")
-            else:
-                print(f"[UNMATCHED] No match found: {file_path.name}")
-                self.unmatched_files.append(file_path.name)
+            # Text extraction and scoring run in worker processes; folder
+            # creation and moves stay on the main process
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(self,)
+            ) as executor:
+                futures = [executor.submit(_score_file, f) for f in pending_files]
+                for future in as_completed(futures):
+                    file_path, result = future.result()
+                    self.place_file(file_path, result)
         
         # Summary
         print(f"\n{'='*60}")
@@ -481,6 +944,39 @@ class ResumeOrganizer:
                 print(f"  ... and {len(self.unmatched_files) - 20} more")
 
 
+# Organizer copy used by worker processes, set once per worker by _init_worker
+_worker_organizer = None
+
+
+def _init_worker(organizer: ResumeOrganizer):
+    """Store the organizer in a worker process so it is only pickled once per worker."""
+    global _worker_organizer
+    _worker_organizer = organizer
+
+
+def _file_size(file_path: Path) -> int:
+    """Size of a file in bytes, or 0 if it cannot be read."""
+    try:
+        return file_path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _score_file(file_path: Path) -> Tuple[Path, Optional[Tuple[Path, str, int]]]:
+    """Analyze a single resume in a worker process."""
+    return file_path, _worker_organizer.find_target_folder_from_content(file_path)
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for integers of at least 1."""
+    import argparse
+    
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def main():
     """Main entry point."""
     import argparse
@@ -504,6 +1000,17 @@ def main():
         type=str,
         help='Path to JSON file with manual filename-to-folder mappings'
     )
+    parser.add_argument(
+        '--workers',
+        type=_positive_int,
+        default=None,
+        help='Number of processes used to analyze resumes (default: CPU count, 1 disables)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=f'Do not reuse or store analysis results in {DEFAULT_CACHE_DIR}'
+    )
     
     args = parser.parse_args()
     
@@ -525,12 +1032,19 @@ def main():
     }
     manual_mappings.update(default_mappings)
     
-    organizer = ResumeOrganizer(args.root_dir, dry_run=not args.execute, manual_mappings=manual_mappings)
+    organizer = ResumeOrganizer(
+        args.root_dir,
+        dry_run=not args.execute,
+        manual_mappings=manual_mappings,
+        max_workers=args.workers,
+        cache_dir=None if args.no_cache else str(DEFAULT_CACHE_DIR)
+    )
     organizer.organize_resumes()
     
     if organizer.dry_run and not args.execute:
         print("\n[INFO] This was a dry run. Use --execute to actually move files.")
         print("[INFO] Install required libraries: pip install PyPDF2 python-docx (or pdfplumber)")
+        print("[INFO] Optional, for faster keyword matching: pip install pyahocorasick")
 
 
 if __name__ == '__main__':